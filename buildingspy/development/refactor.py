@@ -28,6 +28,27 @@ __REC = 1
 __PAC = 2
 __CON = 3
 
+# Position of the entries that are listed at the beginning, and at the end,
+# of the package.order file.
+# Some items can be files or they can be in an own directory
+# such as UsersGuilde/package.mo
+__FIRST = {(__PAC, "UsersGuide"): 0,
+           (__MOD, "UsersGuide"): 1,
+           (__PAC, "Tutorial"): 2,
+           (__MOD, "Tutorial"): 3}
+__LAST = {(__PAC, "Data"): 0,
+          (__MOD, "Data"): 1,
+          (__PAC, "Types"): 2,
+          (__MOD, "Types"): 3,
+          (__PAC, "Examples"): 4,
+          (__PAC, "Validation"): 5,
+          (__PAC, "Benchmarks"): 6,
+          (__PAC, "Experimental"): 7,
+          (__PAC, "Interfaces"): 8,
+          (__PAC, "BaseClasses"): 9,
+          (__PAC, "Internal"): 10,
+          (__PAC, "Obsolete"): 11}
+
 
 def _sort_package_order(package_order):
     """ Sort a list of strings that are the entries of the `packager.order` file.
@@ -37,61 +58,25 @@ def _sort_package_order(package_order):
 
     :param package_order: List of strings that are the entries of the `packager.order` file.
     """
-    from operator import itemgetter
-
-    def moveItemToFront(item, lis):
-        if item in lis:
-            lis.remove(item)
-            lis.insert(0, item)
-        return lis
-
-    def moveItemToEnd(item, lis):
-        if item in lis:
-            lis.remove(item)
-            lis.append(item)
-        return lis
-
-    # Sort models alphabetically
-
     # Per the Modelica standard,
     # "Classes and constants that are stored in package.mo are also present in package.order
     # but their relative order should be identical to the one in package.mo
     # (this ensures that the relative order between classes and constants stored in different ways is preserved).
     # Therefore, we put in the constants in the original order in which they were.
     # See also https://github.com/lbl-srg/modelica-buildings/pull/1874
-    s_con = []
-    s_oth = []
-    for ele in package_order:
+    def sort_key(ele):
+        key = (ele[0], ele[1])
+        if key in __FIRST:
+            return (0, __FIRST[key])
+        if key in __LAST:
+            return (3, __LAST[key])
         if ele[0] == __CON:
-            # We found a constant
-            s_con.append(ele)
-        else:
-            s_oth.append(ele)
-
-    s = sorted(s_oth, key=itemgetter(1))
-    s = sorted(s, key=itemgetter(0))
-
-    # Some items can be files or they can be in an own directory
-    # such as UsersGuilde/package.mo
-    s = moveItemToFront([__MOD, "Tutorial"], s)
-    s = moveItemToFront([__PAC, "Tutorial"], s)
-    s = moveItemToFront([__MOD, "UsersGuide"], s)
-    s = moveItemToFront([__PAC, "UsersGuide"], s)
-    s.extend(s_con)
-    s = moveItemToEnd([__PAC, "Data"], s)
-    s = moveItemToEnd([__MOD, "Data"], s)
-    s = moveItemToEnd([__PAC, "Types"], s)
-    s = moveItemToEnd([__MOD, "Types"], s)
-    s = moveItemToEnd([__PAC, "Examples"], s)
-    s = moveItemToEnd([__PAC, "Validation"], s)
-    s = moveItemToEnd([__PAC, "Benchmarks"], s)
-    s = moveItemToEnd([__PAC, "Experimental"], s)
-    s = moveItemToEnd([__PAC, "Interfaces"], s)
-    s = moveItemToEnd([__PAC, "BaseClasses"], s)
-    s = moveItemToEnd([__PAC, "Internal"], s)
-    s = moveItemToEnd([__PAC, "Obsolete"], s)
-
-    return s
+            # Constants keep their order as sorted() is stable
+            return (2, 0)
+        # Sort models, records and packages alphabetically
+        return (1, ele[0], ele[1])
+
+    return sorted(package_order, key=sort_key)
 
 
 def _sh(cmd, directory):
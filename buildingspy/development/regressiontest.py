@@ -7,6 +7,7 @@
 # MWetter@lbl.gov                            2011-02-23
 #######################################################
 #
+from collections import Counter
 from collections import defaultdict
 from contextlib import contextmanager
 import difflib
@@ -19,6 +20,7 @@ import multiprocessing
 import numbers
 import os
 import re
+import shlex
 import shutil
 import subprocess
 import sys
@@ -38,6 +40,14 @@ from buildingspy.io.postprocess import Plotter
 import buildingspy.io.outputfile as of
 import buildingspy.io.reporter as rep
 
+# Matches the first package list of the form ``A.{B,C}``, see Tester.expand_packages
+_PACKAGE_LIST_RE = re.compile(r'^([^{}]*)\{([^{}]*)\}')
+# Match the plot variables ``y = {...}`` of a line of a mos script, see Tester.get_plot_variables
+_PLOT_VARIABLES_RE = re.compile(r"y\s*=\s*{.*}")
+_INCOMPLETE_PLOT_VARIABLES_RE = re.compile(r"y\s*=\s*{.*\n")
+_CURLY_BRACES_RE = re.compile('{.*?}')
+_COMMA_RE = re.compile(r',\W*')
+
 
 def runSimulation(worDir, cmd):
     """ Run the simulation.
@@ -697,26 +707,18 @@ class Tester(object):
         ``A.{B,C}`` and return ``A.B,A.C``
         :param: packages: A list of packages
         """
-        ids = packages.find('{')
-        if ids < 0:
+        if '{' not in packages:
             # This has no curly bracket notation
             return packages
 
-        ide = packages.find('}')
-
         # Make some simple test for checking the string format
-        if ide - 1 <= ids:
+        mat = _PACKAGE_LIST_RE.match(packages)
+        if mat is None or len(mat.group(2)) == 0:
             raise ValueError("String '{}' is wrong formatted".format(packages))
 
-        # Get text before the curly brackets
-        pre = packages[0:ids]
-        # Get text inside the curly brackets
-        in_bra = packages[ids + 1:ide]
-        entries = in_bra.split(',')
-        # Add the start to the entries
-        pac = []
-        for ele in entries:
-            pac.append("{}{}".format(pre, ele))
+        # Text before the curly brackets, and entries inside the curly brackets
+        pre = mat.group(1)
+        pac = ["{}{}".format(pre, ele) for ele in mat.group(2).split(',')]
         ret = ",".join(pac)
         return ret.replace(' ', '')
 
@@ -859,23 +861,19 @@ class Tester(object):
           True
 
         """
-        import re
-        import shlex
-
-        # Make sure line has no "y = {..." that is not closed, e.g., it spans multiple lines
-        incomplete = re.search(r"y\s*=\s*{.*\n", line)
         # This evaluates for example
         #   re.search("y.*=.*{.*}", "aay = {aa, bb, cc}aa").group()
         #   'y = {aa, bb, cc}'
-        var = re.search(r"y\s*=\s*{.*}", line)
-        if var is None and incomplete is None:
+        var = _PLOT_VARIABLES_RE.search(line)
+        if var is None:
+            # Make sure line has no "y = {..." that is not closed, e.g., it spans multiple lines
+            if _INCOMPLETE_PLOT_VARIABLES_RE.search(line) is not None:
+                msg = "Malformed line '{}'".format(line)
+                raise ValueError(msg)
             return None
-        if var is None and incomplete is not None:
-            msg = "Malformed line '{}'".format(line)
-            raise ValueError(msg)
 
         s = var.group()
-        s = re.search('{.*?}', s).group()
+        s = _CURLY_BRACES_RE.search(s).group()
         s = s.strip('{}')
         # Use the lexer module as simply splitting by "," won't work because arrays have
         # commas in the form "a[1, 1]", "a[1, 2]"
@@ -893,7 +891,7 @@ class Tester(object):
             # Reader to be able to read the result.
             # Also, replace multiple white spaces with a single white space as
             # reading .mat is picky. For example, it refused to read a[1,1] or a[1,  1]
-            y[i] = re.sub(r',\W*', ', ', y[i])
+            y[i] = _COMMA_RE.sub(', ', y[i])
         return y
 
     @staticmethod
@@ -1562,32 +1560,24 @@ class Tester(object):
                     "Stop processing.\n") % (filNam, varNam, len(yOld), len(yInt))
                 )
 
-        errAbs = np.zeros(len(yInt))
-        errRel = np.zeros(len(yInt))
-        errFun = np.zeros(len(yInt))
-
-        for i in range(len(yInt)):
-            errAbs[i] = abs(yOld[i] - yInt[i])
-            if np.isnan(errAbs[i]):
-                raise ValueError('NaN in errAbs ' + varNam + " " + str(yOld[i])
-                                 + "  " + str(yInt[i]) + " i, N " + str(i) +
-                                 " --:" + str(yInt[i - 1])
-                                 + " ++:", str(yInt[i + 1]))
-            if (abs(yOld[i]) > 10 * tol):
-                errRel[i] = errAbs[i] / abs(yOld[i])
-            else:
-                errRel[i] = 0
-            errFun[i] = errAbs[i] + errRel[i]
+        absOld = np.abs(np.asarray(yOld, dtype=float))
+        errAbs = np.abs(np.asarray(yOld, dtype=float) - np.asarray(yInt, dtype=float))
+        isNaN = np.isnan(errAbs)
+        if isNaN.any():
+            i = int(np.argmax(isNaN))
+            raise ValueError('NaN in errAbs ' + varNam + " " + str(yOld[i])
+                             + "  " + str(yInt[i]) + " i, N " + str(i) +
+                             " --:" + str(yInt[i - 1])
+                             + " ++:", str(yInt[i + 1]))
+        # The relative error is only computed for values that are not close to zero
+        errRel = np.divide(errAbs, absOld, out=np.zeros(len(errAbs)), where=absOld > 10 * tol)
+        errFun = errAbs + errRel
 
         t_err_max, warning = 0, None
 
         if max(errFun) > tol:
-            iMax = 0
-            eMax = 0
-            for i in range(len(errFun)):
-                if errFun[i] > eMax:
-                    eMax = errFun[i]
-                    iMax = i
+            # Index of the first occurrence of the maximum error
+            iMax = int(np.argmax(errFun))
             tGri = self._getTimeGrid(tOld[0], tOld[-1], self._nPoi)
             t_err_max = tGri[iMax]
             warning = filNam + ": " + varNam + " has absolute and relative error = " + \
@@ -2351,23 +2341,15 @@ class Tester(object):
         y = s2.strip()
         if x == y:
             return True
-        # If they have a comma, such as from 1, 20, 1, 14, then split it,
-        # sort it, and compare the entries for equality
+        # If they have a comma, such as from 1, 20, 1, 14, then split it
+        # and compare the entries for equality, regardless of their order.
 
         def g(s): return s.replace(" ", "").split(",")
-        # Sort and remove 0, as we are not interested in these equations because
+        # Remove 0, as we are not interested in these equations because
         # they are solved explicitely
-        sp1 = [x for x in sorted(g(x)) if x != '0']
-        sp2 = [x for x in sorted(g(y)) if x != '0']
-        # If the list have different lengths, they are not equal
-        if len(sp1) != len(sp2):
-            return False
-        # They are of equal lengths, compare each element
-        for i in range(len(sp1)):
-            if sp1[i] != sp2[i]:
-                return False
-
-        return True
+        sp1 = Counter(x for x in g(x) if x != '0')
+        sp2 = Counter(x for x in g(y) if x != '0')
+        return sp1 == sp2
 
     def _compare_and_rewrite_fmu_dependencies(
             self,
@@ -1,8 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
+import re
+
 from buildingspy.thirdParty.dymat.DyMat import DyMatFile
 
+# Regular expression for the sizes of the systems of equations, such as {1, 0, 1, 3}
+_SIZES_RE = re.compile(r'\{(.*?)\}')
+
 
 def get_model_statistics(log_file, simulator):
     """ Open the simulation file ``log_file`` and return a dictionary
@@ -35,7 +40,6 @@ def get_model_statistics(log_file, simulator):
         - ``numerical Jacobian``: The number of numerical Jacobians.
     """
     import os
-    import re
 
     if simulator != "dymola":
         raise ValueError('Argument "simulator" needs to be set to "dymola".')
@@ -51,8 +55,6 @@ def get_model_statistics(log_file, simulator):
         dicIni = {}
         dicSim = {}
 
-        reg = re.compile(r'\{(.*?)\}')
-
         CONSTA = "Continuous time states:"
         NONLIN = "Sizes after manipulation of the nonlinear systems:"
         LIN = "Sizes after manipulation of the linear systems:"
@@ -66,14 +68,14 @@ def get_model_statistics(log_file, simulator):
                 ret['translated'] = False
             elif lin.find(NONLIN) > 0:
                 temp = lin.rpartition(":")[2]
-                m = reg.search(temp)
+                m = _SIZES_RE.search(temp)
                 if initalizationMode:
                     dicIni['nonlinear'] = m.group(1)
                 else:
                     dicSim['nonlinear'] = m.group(1)
             elif lin.find(LIN) > 0:
                 temp = lin.rpartition(":")[2]
-                m = reg.search(temp)
+                m = _SIZES_RE.search(temp)
                 if initalizationMode:
                     dicIni['linear'] = m.group(1)
                 else:
@@ -208,8 +210,6 @@ class Reader(object):
               ['PID.P.u', 'PID.gainPID.u', 'PID.limiter.u', 'gain.u', 'PID.I.u', 'PID.gainTrack.u']
 
         """
-        import re
-
         AllNames = self._data_.names()
         if pattern is None:
             return sorted(AllNames)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+""" Functions and classes that are used by several unit test modules.
+
+    This module is not installed with BuildingsPy. The test modules import it
+    as a sibling module if they are run as a script, such as by the Makefile,
+    or by ``unittest discover``, and relative to ``buildingspy.tests`` otherwise.
+"""
+from contextlib import contextmanager
+import concurrent.futures
+import functools
+import glob
+import os
+import shutil
+import tempfile
+import buildingspy.development.regressiontest as r
+
+# Library that is used by the tests
+MY_MO_LIB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "MyModelicaLibrary")
+
+# Content of the files of the library TestLib that are the same for all tests
+_MOS_SCRIPT = """
+simulateModel("TestLib.Test", tolerance=1e-6, stopTime=1.0, method="CVode", resultFile="test");
+createPlot(id=1, y={"Test.x"});
+"""
+_PACKAGE_MO = """
+            within;
+            package TestLib
+            end TestLib;
+"""
+_PACKAGE_ORDER = "TestLib"
+
+# Content of the model TestLib.Test, the model declarations are written by each test
+_MODEL_TEMPLATE = """within TestLib;
+          model Test
+            {}
+            annotation (experiment(Tolerance=1e-6, StopTime=3600));
+          end Test;
+        """
+
+
+@contextmanager
+def working_directory():
+    """ Change to a new temporary working directory, and change back and delete it on exit.
+
+        The log files of the tester are written to the current directory, hence
+        test runs that execute concurrently would otherwise overwrite them.
+        If the block raises an exception, such as a failed assertion, the log files
+        are copied to the original working directory so that they can be inspected.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix='tmp-BuildingsPy-unittests-') as wor_dir:
+        os.chdir(wor_dir)
+        try:
+            yield wor_dir
+        except BaseException:
+            _copy_log_files(wor_dir, cwd)
+            raise
+        finally:
+            os.chdir(cwd)
+
+
+def _copy_log_files(src_dir, dst_dir, prefix=""):
+    """ Copy the files `*.log` from `src_dir` to `dst_dir`, and prepend `prefix` to their names.
+    """
+    for log_file in glob.glob(os.path.join(src_dir, "*.log")):
+        shutil.copy2(log_file, os.path.join(dst_dir, prefix + os.path.basename(log_file)))
+
+
+def _write_template(dir_name):
+    """ Write the package and the mos script of the library TestLib to `dir_name`.
+
+        The model TestLib.Test is written by each test, see `_write_test`.
+    """
+    script_dir = os.path.join(dir_name, "Resources", "Scripts", "Dymola")
+    # Create directory for mos scripts
+    os.makedirs(script_dir)
+    # Write mos file, top-level package and top-level package.order
+    for file_name, content in [(os.path.join(script_dir, "Test.mos"), _MOS_SCRIPT),
+                               (os.path.join(dir_name, 'package.mo'), _PACKAGE_MO),
+                               (os.path.join(dir_name, 'package.order'), _PACKAGE_ORDER)]:
+        with open(file_name, mode="w", encoding="utf-8") as fil:
+            fil.write(content)
+
+
+def _run_diagnostics_test(tool, dir_name):
+    """ Run the unit tests of the library in `dir_name` with `tool`
+        and return the return value of the tester.
+
+        The tests are run in the parent directory of `dir_name`, as the log files are
+        written to the current directory, and the test cases are run concurrently.
+    """
+    os.chdir(os.path.dirname(dir_name))
+    rt = r.Tester(skip_verification=True, check_html=False, tool=tool)
+    # The test cases already run concurrently, hence each tester uses one process
+    rt.setNumberOfThreads(1)
+    rt.setLibraryRoot(dir_name)
+    rt.deleteTemporaryDirectories(True)
+    return rt.run()
+
+
+class RegressionTestMixin:
+    """
+       This class contains the unit tests for
+       :mod:`buildingspy.regressiontest.Tester` that are the same for all tools.
+
+       Derived classes must also derive from `unittest.TestCase`, and set
+
+       - `TOOL` to the name of the tool,
+       - `EXECUTABLE` to the executable that must be on the `PATH` to run the tool, and
+       - `DIAGNOSTICS_TESTS` to a list of dictionaries with the entries `ret_val`,
+         `mo_content` and `description` that are run by `test_regressiontest_diagnostics`.
+    """
+    TOOL = None
+    EXECUTABLE = None
+    DIAGNOSTICS_TESTS = []
+
+    @classmethod
+    def setUpClass(cls):
+        """ Create a scratch directory that contains the libraries written by the tests,
+            and write the files that are the same for all these libraries.
+        """
+        super().setUpClass()
+        cls._scratch = tempfile.TemporaryDirectory(prefix='tmp-BuildingsPy-unittests-')
+        cls._template_dir = os.path.join(cls._scratch.name, "TestLib")
+        _write_template(cls._template_dir)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._scratch.cleanup()
+        super().tearDownClass()
+
+    def _skip_unless_tool_is_installed(self):
+        if shutil.which(self.EXECUTABLE) is None:
+            self.skipTest(f"{self.EXECUTABLE} is not on the PATH")
+
+    def test_unit_test_log_file(self):
+        rt = r.Tester(check_html=False, tool=self.TOOL)
+        self.assertEqual([f'comparison-{self.TOOL}.log', f'simulator-{self.TOOL}.log',
+                         f'unitTests-{self.TOOL}.log'], rt.get_unit_test_log_files())
+
+    def _write_test(self, content):
+        """ Write a unit test for a model with the content `content`
+            in a temporary directory and return the name of this directory.
+        """
+        dir_name = os.path.join(tempfile.mkdtemp(dir=self._scratch.name), "TestLib")
+        mo_content = _MODEL_TEMPLATE.format(content)
+
+        # Copy the package and the mos script, and write the mo file
+        shutil.copytree(self._template_dir, dir_name)
+        with open(os.path.join(dir_name, "Test.mo"), mode="w", encoding="utf-8") as fil:
+            fil.write(mo_content)
+        return dir_name
+
+    def test_regressiontest_diagnostics(self):
+        """ Test that warnings and errors reported by the tool are reported.
+        """
+        self._skip_unless_tool_is_installed()
+        tests = self.DIAGNOSTICS_TESTS
+        # Run all test cases. They are independent, hence run them concurrently.
+        dir_names = [self._write_test(test['mo_content']) for test in tests]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(tests)) as executor:
+            ret_vals = list(executor.map(functools.partial(_run_diagnostics_test, self.TOOL),
+                                         dir_names))
+        for test, dir_name, ret_val in zip(tests, dir_names, ret_vals):
+            des = test['description']
+            with self.subTest(description=des):
+                # Keep the logs of a failed case, as the scratch directory is deleted
+                if ret_val != test['ret_val']:
+                    case_dir = os.path.dirname(dir_name)
+                    _copy_log_files(case_dir, os.getcwd(), f"{os.path.basename(case_dir)}-")
+                # Check return value to see if test succeeded
+                self.assertEqual(
+                    test['ret_val'],
+                    ret_val,
+                    f"Test for '{des}' failed, return value {ret_val}, expected {test['ret_val']}")
+
+    def _run_regression_test(self, skip_verification):
+        self._skip_unless_tool_is_installed()
+        with working_directory():
+            rt = r.Tester(
+                skip_verification=skip_verification,
+                check_html=False,
+                tool=self.TOOL)
+            rt.deleteTemporaryDirectories(True)
+            rt.setLibraryRoot(MY_MO_LIB)
+            rt.batchMode(True)
+            ret_val = rt.run()
+            # Check return value to see if test was successful
+            self.assertEqual(0, ret_val, "Test failed with return value {}".format(ret_val))
+
+    def test_regressiontest(self):
+        self._run_regression_test(skip_verification=True)
+
+    def test_regressiontest_with_verification(self):
+        self._run_regression_test(skip_verification=False)
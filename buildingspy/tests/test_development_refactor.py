@@ -118,29 +118,32 @@ class Test_development_refactor(unittest.TestCase):
 
         workdir = os.getcwd()
         os.chdir(os.path.join("buildingspy", "tests"))
-        filePath = 'MyModelicaLibrary/Examples/FMUs/Gain.mo'
-        self.assertEqual(
-            r._getShortName(
-                filePath,
-                'MyModelicaLibrary.Examples.IntegratorGain'
-            ),
-            ' Examples.IntegratorGain'
-        )
-        self.assertEqual(
-            r._getShortName(
-                filePath,
-                'MyModelicaLibrary.Examples.Test'
-            ),
-            ' Test'
-        )
-        self.assertEqual(
-            r._getShortName(
-                filePath,
-                'MyModelicaLibrary.Examples.FMUs.IntegratorGain'
-            ),
-            ' IntegratorGain'
-        )
-        os.chdir(workdir)
+        # Change back even if an assertion fails, as the other tests use relative paths
+        try:
+            filePath = 'MyModelicaLibrary/Examples/FMUs/Gain.mo'
+            self.assertEqual(
+                r._getShortName(
+                    filePath,
+                    'MyModelicaLibrary.Examples.IntegratorGain'
+                ),
+                ' Examples.IntegratorGain'
+            )
+            self.assertEqual(
+                r._getShortName(
+                    filePath,
+                    'MyModelicaLibrary.Examples.Test'
+                ),
+                ' Test'
+            )
+            self.assertEqual(
+                r._getShortName(
+                    filePath,
+                    'MyModelicaLibrary.Examples.FMUs.IntegratorGain'
+                ),
+                ' IntegratorGain'
+            )
+        finally:
+            os.chdir(workdir)
 
 
 if __name__ == '__main__':
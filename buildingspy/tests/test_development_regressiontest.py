@@ -1,12 +1,101 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
+import copy
 import unittest
 import os
+import shutil
+import numpy as np
+import buildingspy.development.regressiontest as r
+if __package__:
+    from ._helpers import MY_MO_LIB, working_directory
+else:
+    from _helpers import MY_MO_LIB, working_directory
 
 # To run this test, navigate to the BuildingsPy folder, then type
 # python buildingspy/tests/test_development_regressiontest.py
 
+# Flag whether the regression tests can be run with Dymola
+_HAS_DYMOLA = shutil.which("dymola") is not None
+
+# Lines of mos scripts and the plot variables that must be parsed from them,
+# or None if the line has no plot variables
+_PLOT_VARIABLE_CASES = [
+    ("abc", None),
+    ("y=abc", None),
+    ("leftTitleType=1, bottomTitleType=1, colors={{0,0,255},", None),
+    ('y = {"a", "b", "c"}', ["a", "b", "c"]),
+    ('y = {"a","b","c"}', ["a", "b", "c"]),
+    ('y = {" a", "b ", "c"}', ["a", "b", "c"]),
+    ('y = {" a" , "b " , "c"}', ["a", "b", "c"]),
+    ('y = {"a"}', ["a"]),
+    ('y = { "a"}', ["a"]),
+    ('y = { "a" }', ["a"]),
+    ('y ={ "a" }', ["a"]),
+    ('y={ "a" }', ["a"]),
+    ('abc, y = {"a"}', ["a"]),
+    ('x= {"x"}, y = {"a"}, z = {"s"}', ["a"]),
+    ('y={"x_incStrict[1]", "x_incStrict[2]"},', ["x_incStrict[1]", "x_incStrict[2]"]),
+    (' y={"const1[1].y", "const2[1, 1].y"} ', ["const1[1].y", "const2[1, 1].y"])
+]
+
+# Data parsed from the mos script content simulateModel("MyModel.Name")
+_SIMULATE_MODEL_DATA = {'dymola':
+                        {'exportFMU': False,
+                         'translate': True,
+                         'simulate': True,
+                         'TranslationLogFile': 'MyModel.Name.translation.log'},
+                        'model_name': 'MyModel.Name',
+                        'startTime': 0,
+                        'stopTime': 1}
+
+# Content of mos scripts from which the model name MyModel.Name must be parsed
+_MOS_MODEL_NAME_CASES = [
+    """simulateModel("MyModel.Name")
+        """,
+    """
+        simulateModel(
+            "MyModel.Name");
+        """,
+    """
+        simulateModel( "MyModel.Name" );
+        """
+]
+
+# Content of mos scripts from which the start time 1 must be parsed
+_MOS_START_TIME_CASES = [
+    """simulateModel("MyModel.Name",
+          startTime=1)""",
+    """simulateModel("MyModel.Name", startTime=1)""",
+    """simulateModel("MyModel.Name",startTime=1)""",
+    """simulateModel("MyModel.Name", startTime = 1)""",
+    """simulateModel("MyModel.Name", startTime = 1 )""",
+    """simulateModel("MyModel.Name", startTime=+1)""",
+    """simulateModel("MyModel.Name", startTime=1e0)""",
+    """simulateModel("MyModel.Name", startTime=1e+0)""",
+    """simulateModel("MyModel.Name", startTime=1.00e+00)""",
+    """simulateModel("MyModel.Name", startTime=1.00e-00)""",
+    """simulateModel("MyModel.Name",
+          startTime=1e+0)"""
+]
+
+
+# Package lists and their expansion by Tester.expand_packages
+_EXPAND_PACKAGES_CASES = [
+    ("A.B", "A.B"),
+    ("A.{B,C}", "A.B,A.C"),
+    ("A.B.{xy,xy.z}", "A.B.xy,A.B.xy.z"),
+    # Add spaces
+    ("A.{B, C}", "A.B,A.C"),
+    ("A.{ B , C }", "A.B,A.C"),
+    ("A.B.{xy, xy.z}", "A.B.xy,A.B.xy.z"),
+    ("A.B.{ xy, xy.z}", "A.B.xy,A.B.xy.z"),
+    ("A.B.{ xy , xy.z }", "A.B.xy,A.B.xy.z")
+]
+
+# Package lists for which Tester.expand_packages must raise a ValueError
+_INVALID_PACKAGE_LISTS = ["AB{", "AB{}", "AB}a{", "A.{B{C}"]
+
 
 class Test_regressiontest_Tester(unittest.TestCase):
     """
@@ -14,134 +103,103 @@ class Test_regressiontest_Tester(unittest.TestCase):
        :mod:`buildingspy.regressiontest.Tester`.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        """ Create a tester for MyModelicaLibrary that is copied by the tests.
+        """
+        cls._tester = r.Tester(check_html=False)
+        cls._tester.setLibraryRoot(MY_MO_LIB)
+
+    def _get_tester(self):
+        """ Return a new tester whose library root is MyModelicaLibrary.
+        """
+        return copy.deepcopy(self._tester)
+
     def test_get_plot_variables(self):
-        import buildingspy.development.regressiontest as r
-
-        self.assertIsNone(r.Tester.get_plot_variables("abc"), "Expected None return value")
-        self.assertIsNone(r.Tester.get_plot_variables("y=abc"), "Expected None return value")
-        self.assertIsNone(r.Tester.get_plot_variables(
-            "leftTitleType=1, bottomTitleType=1, colors={{0,0,255},"), "Expected None")
-
-        self.assertEqual(["a", "b", "c"], r.Tester.get_plot_variables(
-            'y = {"a", "b", "c"}'), "Expected a b c")
-        self.assertEqual(["a", "b", "c"], r.Tester.get_plot_variables(
-            'y = {"a","b","c"}'), "Expected a b c")
-        self.assertEqual(["a", "b", "c"], r.Tester.get_plot_variables(
-            'y = {" a", "b ", "c"}'), "Expected a b c")
-        self.assertEqual(["a", "b", "c"], r.Tester.get_plot_variables(
-            'y = {" a" , "b " , "c"}'), "Expected a b c")
-        self.assertEqual(["a", "b", "c"], r.Tester.get_plot_variables(
-            'y = {"a","b","c"}'), "Expected a b c")
-        self.assertEqual(["a"], r.Tester.get_plot_variables('y = {"a"}'), "Expected a")
-        self.assertEqual(["a"], r.Tester.get_plot_variables('y = { "a"}'), "Expected a")
-        self.assertEqual(["a"], r.Tester.get_plot_variables('y = { "a" }'), "Expected a")
-        self.assertEqual(["a"], r.Tester.get_plot_variables('y ={ "a" }'), "Expected a")
-        self.assertEqual(["a"], r.Tester.get_plot_variables('y={ "a" }'), "Expected a")
-
-        self.assertEqual(["a"], r.Tester.get_plot_variables('abc, y = {"a"}'), "Expected a")
-        self.assertEqual(["a"], r.Tester.get_plot_variables(
-            'x= {"x"}, y = {"a"}, z = {"s"}'), "Expected a")
-        self.assertEqual(["x_incStrict[1]", "x_incStrict[2]"],
-                         r.Tester.get_plot_variables('y={"x_incStrict[1]", "x_incStrict[2]"},'),
-                         "Expect other result")
-        self.assertEqual(["const1[1].y", "const2[1, 1].y"],
-                         r.Tester.get_plot_variables(' y={"const1[1].y", "const2[1, 1].y"} '))
+        for line, expected in _PLOT_VARIABLE_CASES:
+            with self.subTest(line=line):
+                self.assertEqual(expected, r.Tester.get_plot_variables(line),
+                                 f"Failed to parse plot variables in line='{line}'.")
 
         # Make sure line breaks are raising an error, as they are not parsed
         self.assertRaises(ValueError, r.Tester.get_plot_variables,
                           """y = {"a", "b",
                           "c"}""")
 
-    def _run_regression_test(self, skip_verification):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(skip_verification=skip_verification, check_html=False, tool="dymola")
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.deleteTemporaryDirectories(True)
-        rt.setLibraryRoot(myMoLib)
-        rt.batchMode(True)
-        ret_val = rt.run()
-        # Check return value to see if test succeeded
-        self.assertEqual(0, ret_val, "Test failed with return value {}".format(ret_val))
-        # Delete temporary files
-        for f in rt.get_unit_test_log_files():
-            if os.path.exists(f):
-                os.remove(f)
-
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_regressiontest(self):
-        self._run_regression_test(skip_verification=True)
-
+        with working_directory():
+            rt = r.Tester(skip_verification=True, check_html=False, tool="dymola")
+            rt.deleteTemporaryDirectories(True)
+            rt.setLibraryRoot(MY_MO_LIB)
+            rt.batchMode(True)
+            ret_val = rt.run()
+            # Check return value to see if test succeeded
+            self.assertEqual(0, ret_val, "Test failed with return value {}".format(ret_val))
+
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_regressiontest_with_verification(self):
-        self._run_regression_test(skip_verification=False)
+        with working_directory():
+            rt = r.Tester(skip_verification=False, check_html=False, tool="dymola")
+            rt.deleteTemporaryDirectories(True)
+            rt.setLibraryRoot(MY_MO_LIB)
+            rt.batchMode(True)
+            ret_val = rt.run()
+            # Check return value to see if test succeeded
+            self.assertEqual(0, ret_val, "Test failed with return value {}".format(ret_val))
 
     def test_unit_test_log_file(self):
-        import buildingspy.development.regressiontest as r
         rt = r.Tester(check_html=False, tool="dymola")
         self.assertEqual(['comparison-dymola.log', 'simulator-dymola.log',
                          'unitTests-dymola.log'], rt.get_unit_test_log_files())
 
     def test_regressiontest_invalid_package(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         # Verify that invalid packages raise a ValueError.
         self.assertRaises(ValueError, rt.setSinglePackage, "this.package.does.not.exist")
 
     def test_setSinglePackage(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.include_fmu_tests(True)
         self.assertEqual(0, rt.get_number_of_tests())
 
     def test_setSinglePackage_1(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.include_fmu_tests(True)
         rt.setSinglePackage("MyModelicaLibrary.Examples.FMUs")
         self.assertEqual(3, rt.get_number_of_tests())
 
     def test_setSinglePackage_2(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.include_fmu_tests(True)
         rt.setSinglePackage("MyModelicaLibrary.Examples")
         self.assertEqual(7, rt.get_number_of_tests())
 
     def test_setSinglePackage_3(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.include_fmu_tests(True)
         rt.setSinglePackage("MyModelicaLibrary.Examples.FMUs,MyModelicaLibrary.Examples")
         self.assertEqual(7, rt.get_number_of_tests())
 
     def test_setSinglePackage_4(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.include_fmu_tests(True)
         rt.setSinglePackage("MyModelicaLibrary.Examples,MyModelicaLibrary.Examples.FMUs")
         self.assertEqual(7, rt.get_number_of_tests())
 
     def test_areResultsEqual(self):
         """Test legacy comparison tool."""
-        import buildingspy.development.regressiontest as r
         rt = r.Tester(comp_tool='legacy')
         tMin = 10
         tMax = 50
         nPoi = 101
         tOld = [tMin, tMax]
         yOld = [10, 10]
-        tNew = [tMin + float(i) / (nPoi - 1) * (tMax - tMin) for i in range(nPoi)]
-        yNew = [10.0 for i in range(nPoi)]
+        tNew = np.linspace(tMin, tMax, nPoi)
+        # Only the time grid varies between the cases below.
+        # areResultsEqual does not modify the y values.
+        yConst = np.full(nPoi, 10.0)
+        yNew = yConst.copy()
         varNam = "testVariable"
         filNam = "testFilename"
         (equ, _, _) = rt.areResultsEqual(tOld, yOld, tNew, yNew, varNam, filNam)
@@ -161,19 +219,17 @@ class Test_regressiontest_Tester(unittest.TestCase):
 
         # Test the case where the simulation may have failed and hence the end
         # time is smaller than the end time of the reference results
-        tNew = [tMin + float(i) / (nPoi - 1) * 0.9 * (tMax - tMin) for i in range(nPoi)]
-        yNew = [10.0 for i in range(nPoi)]
-        (equ, timMaxErr, _) = rt.areResultsEqual(tNew, yNew, tOld, yOld, varNam, filNam)
+        tNew = np.linspace(tMin, tMin + 0.9 * (tMax - tMin), nPoi)
+        (equ, timMaxErr, _) = rt.areResultsEqual(tNew, yConst, tOld, yOld, varNam, filNam)
         self.assertFalse(equ, "Test with smaller simulation end time should have returned false.")
         # Test for different start time
-        tNew = [0.1 + tMin + float(i) / (nPoi - 1) * (tMax - tMin) for i in range(nPoi)]
-        (equ, timMaxErr, _) = rt.areResultsEqual(tNew, yNew, tOld, yOld, varNam, filNam)
+        tNew = np.linspace(0.1 + tMin, 0.1 + tMax, nPoi)
+        (equ, timMaxErr, _) = rt.areResultsEqual(tNew, yConst, tOld, yOld, varNam, filNam)
         self.assertFalse(equ, "Test with smaller simulation start time should have returned false.")
 
     def test_statistics_are_equal(self):
-        import buildingspy.development.regressiontest as r
-
-        rt = r.Tester()
+        # This method does not change the state of the tester
+        rt = self._tester
         self.assertTrue(rt.are_statistics_equal("0", "0"))
         self.assertTrue(rt.are_statistics_equal("", ""))
         self.assertTrue(rt.are_statistics_equal(" ", " "))
@@ -187,10 +243,8 @@ class Test_regressiontest_Tester(unittest.TestCase):
         self.assertTrue(rt.are_statistics_equal("1, 0, 0, 40", "1, 40, 0"))
 
     def test_format_float(self):
-        import buildingspy.development.regressiontest as r
-
-        rt = r.Tester()
-
+        # This method does not change the state of the tester
+        rt = self._tester
         self.assertEqual(float(rt.format_float(1.0)), float(1))
         self.assertEqual(float(rt.format_float(0.5)), float(0.5))
         self.assertEqual(float(rt.format_float(1.234)), float(1.234))
@@ -201,10 +255,8 @@ class Test_regressiontest_Tester(unittest.TestCase):
         self.assertEqual(float(rt.format_float(-100.0123)), float(-100.0123))
 
     def test_setLibraryRoot(self):
-        import buildingspy.development.regressiontest as r
-
         rt = r.Tester()
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
+        myMoLib = MY_MO_LIB
         # This call should succeed, even if used twice
         rt.setLibraryRoot(myMoLib)
         rt.setLibraryRoot(myMoLib)
@@ -213,58 +265,26 @@ class Test_regressiontest_Tester(unittest.TestCase):
                           rt.setLibraryRoot, "this_is_not_the_root_dir_of_a_library")
 
     def test_set_data_attributes_from_mos(self):
-        import buildingspy.development.regressiontest as r
-
         content = """
         simulateModel("MyModel.Name");
         """
         data, err = r.Tester._set_data_attributes_from_mos(mos_content=content)
-        expected_result = {'dymola':
-                           {'exportFMU': False,
-                            'translate': True,
-                            'simulate': True,
-                            'TranslationLogFile': 'MyModel.Name.translation.log'},
-                           'model_name': 'MyModel.Name',
-                           'startTime': 0,
-                           'stopTime': 1}
         self.assertIsNone(err, f"Received unexpected error: {err}")
-        self.assertDictEqual(data, expected_result, "Failed to parse model name.")
+        self.assertDictEqual(data, _SIMULATE_MODEL_DATA, "Failed to parse model name.")
 
         # Test parsing with line breaks and spaces
-        for content in [
-            """simulateModel("MyModel.Name")
-        """,
-            """
-        simulateModel(
-            "MyModel.Name");
-        """,
-            """
-        simulateModel( "MyModel.Name" );
-        """
-        ]:
-            data, err = r.Tester._set_data_attributes_from_mos(mos_content=content)
-            self.assertEqual(data, {**data, **{"model_name": "MyModel.Name"}},
-                             f"Failed to parse line ending in content='{content}'.")
+        for content in _MOS_MODEL_NAME_CASES:
+            with self.subTest(content=content):
+                data, err = r.Tester._set_data_attributes_from_mos(mos_content=content)
+                self.assertEqual(data, _SIMULATE_MODEL_DATA,
+                                 f"Failed to parse line ending in content='{content}'.")
 
         # Test parsing of time
-        for content in [
-            """simulateModel("MyModel.Name",
-          startTime=1)""",
-            """simulateModel("MyModel.Name", startTime=1)""",
-            """simulateModel("MyModel.Name",startTime=1)""",
-            """simulateModel("MyModel.Name", startTime = 1)""",
-            """simulateModel("MyModel.Name", startTime = 1 )""",
-            """simulateModel("MyModel.Name", startTime=+1)""",
-            """simulateModel("MyModel.Name", startTime=1e0)""",
-            """simulateModel("MyModel.Name", startTime=1e+0)""",
-            """simulateModel("MyModel.Name", startTime=1.00e+00)""",
-            """simulateModel("MyModel.Name", startTime=1.00e-00)""",
-            """simulateModel("MyModel.Name",
-          startTime=1e+0)"""
-        ]:
-            data, err = r.Tester._set_data_attributes_from_mos(mos_content=content)
-            self.assertEqual(data, {**data, **{"startTime": 1}},
-                             f"Failed to parse startTime in content='{content}'.")
+        for content in _MOS_START_TIME_CASES:
+            with self.subTest(content=content):
+                data, err = r.Tester._set_data_attributes_from_mos(mos_content=content)
+                self.assertEqual(data, {**_SIMULATE_MODEL_DATA, "startTime": 1},
+                                 f"Failed to parse startTime in content='{content}'.")
 
         content = """
             translateModelFMU(
@@ -291,40 +311,17 @@ class Test_regressiontest_Tester(unittest.TestCase):
         self.assertDictEqual(data, expected_result, "Failed to parse model name.")
 
     def test_setDataDictionary(self):
-        import buildingspy.development.regressiontest as r
-        rt = r.Tester(check_html=False)
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        rt.setLibraryRoot(myMoLib)
+        rt = self._get_tester()
         rt.setDataDictionary()
 
     def test_expand_packages(self):
-        import buildingspy.development.regressiontest as r
-
-        self.assertEqual("A.B",
-                         r.Tester.expand_packages("A.B"))
-        self.assertEqual("A.B,A.C",
-                         r.Tester.expand_packages("A.{B,C}"))
-        self.assertEqual("A.B.xy,A.B.xy.z",
-                         r.Tester.expand_packages("A.B.{xy,xy.z}"))
-
-        # Add spaces
-        self.assertEqual("A.B,A.C",
-                         r.Tester.expand_packages("A.{B, C}"))
-        self.assertEqual("A.B,A.C",
-                         r.Tester.expand_packages("A.{ B , C }"))
-        self.assertEqual("A.B.xy,A.B.xy.z",
-                         r.Tester.expand_packages("A.B.{xy, xy.z}"))
-        self.assertEqual("A.B.xy,A.B.xy.z",
-                         r.Tester.expand_packages("A.B.{ xy, xy.z}"))
-        self.assertEqual("A.B.xy,A.B.xy.z",
-                         r.Tester.expand_packages("A.B.{ xy , xy.z }"))
+        for packages, expected in _EXPAND_PACKAGES_CASES:
+            with self.subTest(packages=packages):
+                self.assertEqual(expected, r.Tester.expand_packages(packages))
 
-        self.assertRaises(ValueError,
-                          r.Tester.expand_packages, "AB{")
-        self.assertRaises(ValueError,
-                          r.Tester.expand_packages, "AB{}")
-        self.assertRaises(ValueError,
-                          r.Tester.expand_packages, "AB}a{")
+        for packages in _INVALID_PACKAGE_LISTS:
+            with self.subTest(packages=packages):
+                self.assertRaises(ValueError, r.Tester.expand_packages, packages)
 
     def test_get_coverage_single_package(self):
         coverage_result = self._test_get_and_print_coverage(package="Examples")
@@ -343,10 +340,7 @@ class Test_regressiontest_Tester(unittest.TestCase):
         self.assertEqual(len(coverage_result[4]), 2)
 
     def _test_get_and_print_coverage(self, package: str = None):
-        import buildingspy.development.regressiontest as r
-        ut = r.Tester(tool='dymola')
-        myMoLib = os.path.join("buildingspy", "tests", "MyModelicaLibrary")
-        ut.setLibraryRoot(myMoLib)
+        ut = self._get_tester()
         if package is not None:
             ut.setSinglePackage(package)
         coverage_result = ut.getCoverage()
@@ -356,8 +350,11 @@ class Test_regressiontest_Tester(unittest.TestCase):
         self.assertIsInstance(coverage_result[2], int)
         self.assertIsInstance(coverage_result[3], list)
         self.assertIsInstance(coverage_result[4], list)
-        # Check print with both custom and standard printer
-        ut.printCoverage(*coverage_result, printer=print)
+        # Check print with both custom and standard printer.
+        # The custom printer collects the lines rather than writing them to stdout.
+        lines = []
+        ut.printCoverage(*coverage_result, printer=lines.append)
+        self.assertTrue(lines[0].startswith('***\nModel Coverage:'))
         ut.printCoverage(*coverage_result)
         return coverage_result
 
@@ -1,7 +1,11 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
+import os
+import shutil
+import tempfile
 import unittest
+import zipfile
 
 
 class Test_example_dymola_runSimulation(unittest.TestCase):
@@ -10,59 +14,64 @@ class Test_example_dymola_runSimulation(unittest.TestCase):
        :mod:`buildingspy.examples`.
     """
 
-    def __init__(self, *args, **kwargs):
-        """
-        Constructor.
+    @classmethod
+    def setUpClass(cls):
+        """ Download the Modelica Buildings Library that is used by the tests.
+
+            The library is not changed by the tests, hence it is downloaded
+            only once for all tests of this class.
+            If the environment variable ``BUILDINGSPY_MODELICA_BUILDINGS_DIR``
+            is set to the directory of the library ``Buildings`` v11.0.0,
+            this library is copied rather than downloaded, and if it is set
+            to a path that is not a directory, a `ValueError` is raised.
+            Otherwise, if ``BUILDINGSPY_SKIP_NETWORK_TESTS`` is set,
+            the tests are skipped.
         """
-        super(Test_example_dymola_runSimulation, self).__init__(*args, **kwargs)
+        cls._buiDir = os.path.join(os.getcwd(), "Buildings")
 
-        self._temDir = None
-        self._buiDir = None
+        cached = os.environ.get("BUILDINGSPY_MODELICA_BUILDINGS_DIR")
+        if cached:
+            if not os.path.isdir(cached):
+                raise ValueError(
+                    f"BUILDINGSPY_MODELICA_BUILDINGS_DIR is set to '{cached}', "
+                    "which is not a directory.")
+            # Fails if the directory exists, as it is deleted by tearDownClass
+            shutil.copytree(cached, cls._buiDir)
+            return
+        if os.environ.get("BUILDINGSPY_SKIP_NETWORK_TESTS"):
+            raise unittest.SkipTest("BUILDINGSPY_SKIP_NETWORK_TESTS is set")
 
-    def setUp(self):
-        """ Ensure that environment variables that are needed to run
-            the tests are set
-        """
-        import tempfile
-        import os
-        import shutil
         import requests
-        import zipfile
-        from io import BytesIO
-
-        self._temDir = tempfile.mkdtemp(prefix='tmp-BuildingsPy-Modelica-Lib-')
-        self._buiDir = os.path.join(os.getcwd(), "Buildings")
 
         zip_file_url = "https://github.com/lbl-srg/modelica-buildings/archive/refs/tags/v11.0.0.zip"
 
-        r = requests.get(zip_file_url)
-        # Split URL to get the file name
-        zip_file = zip_file_url.split('/')[-1]
-        # Writing the file to the local file system
-        with open(zip_file, 'wb') as output_file:
-            output_file.write(r.content)
-        z = zipfile.ZipFile(BytesIO(r.content))
-        z.extractall()
-        shutil.move(os.path.join("modelica-buildings-11.0.0", "Buildings"), "Buildings")
-        shutil.rmtree("modelica-buildings-11.0.0")
+        # Stream the archive to a temporary file rather than holding it in memory
+        with requests.get(zip_file_url, stream=True) as r, tempfile.TemporaryFile() as zip_file:
+            r.raise_for_status()
+            for chunk in r.iter_content(chunk_size=1 << 20):
+                zip_file.write(chunk)
+            # Extract only the package Buildings, and rename it to the directory Buildings.
+            # The extraction directory is in the current directory to allow a rename.
+            top_dir = "modelica-buildings-11.0.0"
+            with zipfile.ZipFile(zip_file) as z, \
+                    tempfile.TemporaryDirectory(dir=os.getcwd()) as ext_dir:
+                for info in z.infolist():
+                    if info.filename.startswith(f"{top_dir}/Buildings/"):
+                        z.extract(info, ext_dir)
+                os.rename(os.path.join(ext_dir, top_dir, "Buildings"), cls._buiDir)
 
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """ Method called after all the tests.
         """
-        # Delete temporary directory
-        import shutil
-        import os
-        shutil.rmtree(self._buiDir)
-        zipFil = "v11.0.0.zip"
-        if os.path.exists(zipFil):
-            os.remove(zipFil)
+        # Delete the library
+        shutil.rmtree(cls._buiDir)
 
     def test_runSimulation(self):
         """
         Tests the :mod:`buildingspy/examples/dymola/runSimulation`
         function.
         """
-        import os
         import buildingspy.examples.dymola.runSimulation as s
         s.main()
 
@@ -71,7 +80,6 @@ class Test_example_dymola_runSimulation(unittest.TestCase):
         Tests the :mod:`buildingspy/examples/dymola/plotResult`
         function.
         """
-        import os
         import buildingspy.examples.dymola.plotResult as s
         s.main()
         # Remove the generated plot files
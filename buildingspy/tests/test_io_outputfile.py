@@ -5,24 +5,8 @@ import unittest
 import buildingspy.io.outputfile as of
 import numpy.testing
 
-
-class Test_io_Reader(unittest.TestCase):
-    """
-       This class contains the unit tests for
-       :mod:`buildingspy.io.Reader`.
-    """
-
-    def test_get_simulation_statistics(self):
-        """
-        Tests the :mod:`buildingspy.io.Reader.get_simulation_statistics`
-        function.
-        """
-        import os
-
-        # Name of temporary file
-        staFil = "test_stat_file.txt"
-        # Write a file that contains the simulation statistics as reported by Dymola
-        s = """
+# Simulation statistics as reported by Dymola
+_DYMOLA_STATISTICS = """
 Translation of Buildings.Examples.ChillerPlant.DataCenterContinuousTimeControl:
 
 The DAE has 1795 scalar unknowns and 1795 scalar equations.
@@ -60,8 +44,25 @@ Translated Model
     Number of numerical Jacobians: 0
         """
 
+
+class Test_io_Reader(unittest.TestCase):
+    """
+       This class contains the unit tests for
+       :mod:`buildingspy.io.Reader`.
+    """
+
+    def test_get_simulation_statistics(self):
+        """
+        Tests the :mod:`buildingspy.io.Reader.get_simulation_statistics`
+        function.
+        """
+        import os
+
+        # Name of temporary file
+        staFil = "test_stat_file.txt"
+        # Write a file that contains the simulation statistics as reported by Dymola
         with open(staFil, mode="w", encoding="utf-8") as fil:
-            fil.write(s)
+            fil.write(_DYMOLA_STATISTICS)
 
         # Test the function
         stats = of.get_model_statistics(staFil, 'dymola')
@@ -1,9 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
+import concurrent.futures
 import unittest
 import os
+import shutil
 from buildingspy.simulate.Dymola import Simulator
+if __package__:
+    from ._helpers import MY_MO_LIB
+else:
+    from _helpers import MY_MO_LIB
+
+# Flag whether the tests that translate or simulate a model can be run
+_HAS_DYMOLA = shutil.which("dymola") is not None
 
 
 def _simulate(cas):
@@ -11,10 +20,7 @@ def _simulate(cas):
     Class to simulate models. This needs to be at the top-level for multiprocessing
     to be able to serialize it.
     """
-    from buildingspy.simulate.Dymola import Simulator
-
-    packagePath = os.path.abspath(os.path.join("buildingspy", "tests", "MyModelicaLibrary"))
-    s = Simulator(cas['model'], outputDirectory=f"out-{cas['tol']}", packagePath=packagePath)
+    s = Simulator(cas['model'], outputDirectory=f"out-{cas['tol']}", packagePath=MY_MO_LIB)
     s.setTolerance(cas['tol'])
     s.simulate()
 
@@ -25,13 +31,13 @@ class Test_simulate_Simulator(unittest.TestCase):
        :mod:`buildingspy.simulate.Dymola`.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         This method creates a variable that points to an existing folder
         that contains a Modelica package.
         """
-        self._packagePath = os.path.abspath(os.path.join(
-            "buildingspy", "tests", "MyModelicaLibrary"))
+        cls._packagePath = MY_MO_LIB
 
     def test_Constructor(self):
         """
@@ -74,6 +80,7 @@ class Test_simulate_Simulator(unittest.TestCase):
                 outputDirectory=".",
                 packagePath="THIS IS NOT A VALID PACKAGE PATH")
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_translate(self):
         """
         Tests the various add methods.
@@ -82,6 +89,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         s.translate()
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_simulate_user_library(self):
         """
         Tests simulating a model from the Modelica Standard Library.
@@ -91,6 +99,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         s.simulate()
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_simulate_msl(self):
         """
         Tests simulating a model from the Modelica Standard Library.
@@ -101,6 +110,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         s.simulate()
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_addMethods(self):
         """
         Tests the various add methods.
@@ -155,6 +165,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         # Arguments must be a dictionary
         self.assertRaises(ValueError, s.addParameters, ["aaa", "bbb"])
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_addVectorOfParameterValues(self):
         """
         Tests the :mod:`buildingspy.simulate.Dymola.addParameters`
@@ -191,6 +202,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         # Delete output files
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_setBooleanParameterValues(self):
         """
         Tests the :mod:`buildingspy.simulate.Dymola.addParameters`
@@ -232,6 +244,7 @@ class Test_simulate_Simulator(unittest.TestCase):
             s.simulate()
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_timeout(self, timeout=0.0001):
         model = 'MyModelicaLibrary.MyModelTimeOut'
         s = Simulator(
@@ -256,12 +269,8 @@ class Test_simulate_Simulator(unittest.TestCase):
         self.assertTrue('Integration terminated successfully' in log)
         s.deleteOutputFiles()
 
+    @unittest.skipUnless(_HAS_DYMOLA, "dymola is not on the PATH")
     def test_multiprocessing(self):
-        import os
-        import shutil
-        from multiprocessing import Pool
-        import json
-
         def _deleteDirs(cases):
             for cas in cases:
                 output_dir = f"out-{cas['tol']}"
@@ -274,9 +283,9 @@ class Test_simulate_Simulator(unittest.TestCase):
         # Delete old directories
         _deleteDirs(cases)
 
-        p = Pool()
-        p.map(_simulate, cases)
-        p.close()
+        # Use one process per case, as each case runs one simulation
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(cases)) as executor:
+            list(executor.map(_simulate, cases))
 
         # Check output for success
         for cas in cases:
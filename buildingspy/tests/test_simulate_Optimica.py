@@ -1,9 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 #
+import concurrent.futures
 import unittest
 import os
 from buildingspy.simulate.Optimica import Simulator
+if __package__:
+    from ._helpers import MY_MO_LIB
+else:
+    from _helpers import MY_MO_LIB
 
 
 def _simulate(cas):
@@ -11,10 +16,7 @@ def _simulate(cas):
     Class to simulate models. This needs to be at the top-level for multiprocessing
     to be able to serialize it.
     """
-    from buildingspy.simulate.Optimica import Simulator
-
-    packagePath = os.path.abspath(os.path.join("buildingspy", "tests", "MyModelicaLibrary"))
-    s = Simulator(cas['model'], outputDirectory=f"out-{cas['tol']}", packagePath=packagePath)
+    s = Simulator(cas['model'], outputDirectory=f"out-{cas['tol']}", packagePath=MY_MO_LIB)
     s.setTolerance(cas['tol'])
     s.simulate()
 
@@ -25,13 +27,13 @@ class Test_simulate_Simulator(unittest.TestCase):
        :mod:`buildingspy.simulate.Optimica`.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         This method creates a variable that points to an existing folder
         that contains a Modelica package.
         """
-        self._packagePath = os.path.abspath(os.path.join(
-            "buildingspy", "tests", "MyModelicaLibrary"))
+        cls._packagePath = MY_MO_LIB
 
     def test_Constructor(self):
         """
@@ -323,9 +325,7 @@ class Test_simulate_Simulator(unittest.TestCase):
         s.deleteOutputFiles()
 
     def test_multiprocessing(self):
-        import os
         import shutil
-        from multiprocessing import Pool
         import json
 
         def _deleteDirs(cases):
@@ -340,9 +340,9 @@ class Test_simulate_Simulator(unittest.TestCase):
         # Delete old directories
         _deleteDirs(cases)
 
-        p = Pool()
-        p.map(_simulate, cases)
-        p.close()
+        # Use one process per case, as each case runs one simulation
+        with concurrent.futures.ProcessPoolExecutor(max_workers=len(cases)) as executor:
+            list(executor.map(_simulate, cases))
 
         # Check output for success
         for cas in cases:
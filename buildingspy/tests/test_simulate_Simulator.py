@@ -4,6 +4,10 @@
 import unittest
 import os
 from buildingspy.simulate.base_simulator import _BaseSimulator
+if __package__:
+    from ._helpers import MY_MO_LIB
+else:
+    from _helpers import MY_MO_LIB
 
 
 class Test_simulate_Simulator(unittest.TestCase):
@@ -12,13 +16,13 @@ class Test_simulate_Simulator(unittest.TestCase):
        :mod:`buildingspy.simulate.Dymola`.
     """
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """
         This method creates a variable that points to an existing folder
         that contains a Modelica package.
         """
-        self._packagePath = os.path.abspath(os.path.join(
-            "buildingspy", "tests", "MyModelicaLibrary"))
+        cls._packagePath = MY_MO_LIB
 
     def test_Constructor(self):
         """